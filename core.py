@@ -1,6 +1,13 @@
 import bpy
 
-from .geometry import dump_geometry_node, load_geometry_node
+from .geometry import (
+    dump_geometry_node,
+    dump_geometry_nodes,
+    is_multi_geometry_node,
+    load_geometry_node,
+    load_geometry_nodes,
+    parse_yaml,
+)
 from .register_class import _get_cls, operator
 
 
@@ -29,6 +36,28 @@ class CGT_OT_geometry_copy(bpy.types.Operator):
         return {"FINISHED"}
 
 
+class CGT_OT_geometry_copy_selected(bpy.types.Operator):
+    """Copy nodes of selected objects"""
+
+    bl_idname = "object.geometry_copy_selected"
+    bl_label = "Copy Selected"
+    bl_description = "Serialize geometry nodes of selected objects."
+
+    simple: bpy.props.BoolProperty() = bpy.props.BoolProperty()  # type: ignore
+    idname: bpy.props.BoolProperty() = bpy.props.BoolProperty()  # type: ignore
+
+    def execute(self, context):
+        if not (objs := bpy.context.selected_objects):
+            self.report({"WARNING"}, "Select objects.")
+            return {"CANCELLED"}
+        if not (yml := dump_geometry_nodes(objs, simple=self.simple, idname=self.idname)):
+            self.report({"WARNING"}, "Add geometry node.")
+            return {"CANCELLED"}
+        bpy.context.window_manager.clipboard = yml
+        self.report({"INFO"}, "Copied to clipboard.")
+        return {"FINISHED"}
+
+
 class CGT_OT_geometry_paste(bpy.types.Operator):
     """Paste nodes"""
 
@@ -37,6 +66,16 @@ class CGT_OT_geometry_paste(bpy.types.Operator):
     bl_description = "Deserialize geometry nodes."
 
     def execute(self, context):
+        yml = parse_yaml(str(bpy.context.window_manager.clipboard))
+        if is_multi_geometry_node(yml):
+            reused, missing = load_geometry_nodes(yml)
+            if missing:
+                msg = f"Reused {reused} node groups. Not found objects: {', '.join(missing)}"
+                self.report({"WARNING"}, msg)
+            else:
+                self.report({"INFO"}, f"Reused {reused} node groups.")
+            ops_func(bpy.ops.node.view_all, "NODE_EDITOR")
+            return {"FINISHED"}
         if not (obj := bpy.context.object):
             self.report({"WARNING"}, "Select object.")
             return {"CANCELLED"}
@@ -45,7 +84,8 @@ class CGT_OT_geometry_paste(bpy.types.Operator):
             modifiers = bpy.context.object.modifiers.new("GeometryNodes", "NODES")
         if not modifiers.node_group:
             modifiers.node_group = bpy.data.node_groups.new("Geometry Nodes", "GeometryNodeTree")
-        load_geometry_node(str(bpy.context.window_manager.clipboard))
+        reused = load_geometry_node(yml)
+        self.report({"INFO"}, f"Reused {reused} node groups.")
         ops_func(bpy.ops.node.view_all, "NODE_EDITOR")
         return {"FINISHED"}
 
@@ -62,6 +102,9 @@ class CGT_PT_bit(bpy.types.Panel):
         prop = operator(self.layout, CGT_OT_geometry_copy)
         prop.simple = context.scene.simple
         prop.idname = context.scene.idname
+        prop = operator(self.layout, CGT_OT_geometry_copy_selected)
+        prop.simple = context.scene.simple
+        prop.idname = context.scene.idname
         operator(self.layout, CGT_OT_geometry_paste)
 
 
@@ -37,12 +37,12 @@ def load_attr(nd: bpy.types.Node, name: str, value: object) -> None:
     setattr(nd, name, value)
 
 
-def dump_mapping(mapping: bpy.types.CurveMapping) -> str:
+def dump_mapping(mapping: bpy.types.CurveMapping) -> list[str]:
     res = ["    mapping:"]
     for pnt in mapping.curves[0].points:
         x, y = map(partial(round, ndigits=2), pnt.location)
         res.append(f"    - {pnt.handle_type}, {x}, {y}")
-    return "\n".join(res)
+    return res
 
 
 def load_mapping(mapping: bpy.types.CurveMapping, value: list[str]) -> None:
@@ -105,6 +105,105 @@ def inputs_links(sc):
     return lst
 
 
+def collect_node_groups(
+    roots: list[bpy.types.GeometryNodeTree],
+) -> list[bpy.types.GeometryNodeTree]:
+    """ルートから参照されるノードグループを依存順(参照先が先)に返す
+
+    :param roots: ルートのノードグループのリスト
+    :return: ノードグループのリスト(重複なし)
+    """
+    node_groups, visited = [], set()
+
+    def visit(node_group):
+        if node_group is None or node_group.name in visited:
+            return
+        visited.add(node_group.name)
+        for nd in node_group.nodes:
+            if nd.bl_idname == "GeometryNodeGroup":
+                visit(nd.node_tree)
+        node_groups.append(node_group)
+
+    for root in roots:
+        visit(root)
+    return node_groups
+
+
+def dump_node_group(
+    node_group: bpy.types.GeometryNodeTree, simple: bool, idname: bool
+) -> list[str]:
+    """ノードグループ1つ分のYAMLの行を返す
+
+    :param node_group: ノードグループ
+    :param simple: widthとlabelを出さないか
+    :param idname: bl_idnameを出さないか
+    :return: YAMLの行のリスト
+    """
+    result = [f"{node_group.name}:"]
+    for key, data in zip(["Inputs", "Outputs"], [node_group.inputs, node_group.outputs]):
+        if data:
+            result.append(f"  {key}:")
+            for sc in data:
+                typ = sc.bl_socket_idname
+                info = f"    {sc.identifier}: {sc.name}/{typ}"
+                if typ == "NodeSocketFloatFactor":
+                    info += f", {sc.default_value}, {sc.min_value}, {sc.max_value}"
+                result.append(info)
+    nodes = sorted(node_group.nodes, key=sort_node)
+    for nd in nodes:
+        # 未使用の出力は無視する
+        if getattr(nd, "is_active_output", None) is False:
+            continue
+        result.append(f"  {nd.name}:")
+        bl_idname = nd.bl_idname if idname else minimum_class_name(nd)
+        if bl_idname:
+            result.append(f"    bl_idname: {bl_idname}")
+        if nd.label and not simple:
+            result.append(dump_attr(nd, "label"))
+        if nd.bl_idname == "GeometryNodeGroup":
+            result.append(f"    node_tree: {nd.node_tree.name}")
+        result.append(dump_attr(nd, "location", int))
+        if not simple:
+            result.append(dump_attr(nd, "width", int))
+        if nd.hide:
+            result.append(dump_attr(nd, "hide"))
+        if nd.use_custom_color:
+            result.append(dump_attr(nd, "color"))
+        n = len(nd.bl_rna.base.properties)
+        for pr in nd.bl_rna.properties[n:]:
+            name = pr.identifier
+            value = getattr(nd, name)
+            if name == "mapping":
+                result.extend(dump_mapping(value))
+            elif is_struct(value):
+                continue
+            elif not isinstance(value, bpy.types.PropertyGroup) and name != "is_active_output":
+                result.append(f"    {name}: {value}")
+        inputs = []
+        for i, sc in enumerate(nd.inputs):
+            name = sc.name
+            if sc.name in {"Vector", "Value"} or nd.bl_idname == "GeometryNodeGroup":
+                name = i
+            if lst := inputs_links(sc):
+                inputs.append((name, "~" + ";".join(lst)))
+            elif hasattr(sc, "default_value"):
+                dval = sc.default_value
+                if isinstance(dval, (bpy.types.Object, bpy.types.Material)):
+                    dval = f"{dval.name}"
+                if is_struct(dval):
+                    continue
+                elif isinstance(dval, (mathutils.Vector, mathutils.Euler)):
+                    dval = list(dval)
+                elif isinstance(dval, float):
+                    dval = round(dval, 6)
+                inputs.append((i, dval))
+        if inputs:
+            result.append("    inputs:")
+            for name, dval in inputs:
+                result.append(f"      {name}: {dval}")
+    return result
+
+
 def dump_geometry_node(
     obj: bpy.types.Object = None, simple: bool = False, idname: bool = False
 ) -> str:
@@ -119,152 +218,206 @@ def dump_geometry_node(
     modifiers = next(iter([m for m in obj.modifiers if m.type == "NODES"]), None)
     if not modifiers or not modifiers.node_group:
         return ""
-    node_groups, remain = [], [modifiers.node_group]
-    while remain:
-        node_group = remain.pop()
-        node_groups.append(node_group)
-        for nd in node_group.nodes:
-            if nd.bl_idname == "GeometryNodeGroup":
-                ng = nd.node_tree
-                if ng not in node_groups:
-                    remain.append(ng)
     result = []
-    for node_group in reversed(node_groups):
-        result.append(f"{node_group.name}:")
-        for key, data in zip(["Inputs", "Outputs"], [node_group.inputs, node_group.outputs]):
-            if data:
-                result.append(f"  {key}:")
-                for sc in data:
-                    typ = sc.bl_socket_idname
-                    info = f"    {sc.identifier}: {sc.name}/{typ}"
-                    if typ == "NodeSocketFloatFactor":
-                        info += f", {sc.default_value}, {sc.min_value}, {sc.max_value}"
-                    result.append(info)
-        nodes = sorted(node_group.nodes, key=sort_node)
-        for nd in nodes:
-            # 未使用の出力は無視する
-            if getattr(nd, "is_active_output", None) is False:
-                continue
-            result.append(f"  {nd.name}:")
-            bl_idname = nd.bl_idname if idname else minimum_class_name(nd)
-            if bl_idname:
-                result.append(f"    bl_idname: {bl_idname}")
-            if nd.label and not simple:
-                result.append(dump_attr(nd, "label"))
-            if nd.bl_idname == "GeometryNodeGroup":
-                result.append(f"    node_tree: {nd.node_tree.name}")
-            result.append(dump_attr(nd, "location", int))
-            if not simple:
-                result.append(dump_attr(nd, "width", int))
-            if nd.hide:
-                result.append(dump_attr(nd, "hide"))
-            if nd.use_custom_color:
-                result.append(dump_attr(nd, "color"))
-            n = len(nd.bl_rna.base.properties)
-            for pr in nd.bl_rna.properties[n:]:
-                name = pr.identifier
-                value = getattr(nd, name)
-                if name == "mapping":
-                    result.append(dump_mapping(value))
-                elif is_struct(value):
-                    continue
-                elif not isinstance(value, bpy.types.PropertyGroup) and name != "is_active_output":
-                    result.append(f"    {name}: {value}")
-            inputs = []
-            for i, sc in enumerate(nd.inputs):
-                name = sc.name
-                if sc.name in {"Vector", "Value"} or nd.bl_idname == "GeometryNodeGroup":
-                    name = i
-                if lst := inputs_links(sc):
-                    inputs.append((name, "~" + ";".join(lst)))
-                elif hasattr(sc, "default_value"):
-                    dval = sc.default_value
-                    if isinstance(dval, (bpy.types.Object, bpy.types.Material)):
-                        dval = f"{dval.name}"
-                    if is_struct(dval):
-                        continue
-                    elif isinstance(dval, (mathutils.Vector, mathutils.Euler)):
-                        dval = list(dval)
-                    elif isinstance(dval, float):
-                        dval = round(dval, 6)
-                    inputs.append((i, dval))
-            if inputs:
-                result.append("    inputs:")
-                for name, dval in inputs:
-                    result.append(f"      {name}: {dval}")
+    for node_group in collect_node_groups([modifiers.node_group]):
+        result.extend(dump_node_group(node_group, simple, idname))
     return "\n".join(result)
 
 
-def load_geometry_node(yml: Union[dict[str, Any], str], obj: bpy.types.Object = None) -> None:
-    """YAMLからジオメトリーノードを作成する
+def dump_geometry_nodes(
+    objs: list[bpy.types.Object] = None, simple: bool = False, idname: bool = False
+) -> str:
+    """複数オブジェクトのジオメトリーノードのYAMLを返す
 
-    :param yml: YAML
-    :param obj: オブジェクト
+    共有されるノードグループは1回だけ出力し、
+    オブジェクトごとのモディファイアーとノードグループの対応をObjectsに出力する
+
+    :param objs: オブジェクトのリスト
+    :param simple: widthとlabelを出さないか
+    :param idname: bl_idnameを出さないか
+    :return: YAML
     """
-    yml = yaml.safe_load(yml) if isinstance(yml, str) else yml
-    node_group_name = list(yml)[-1] if yml else ""
+    objs = bpy.context.selected_objects if objs is None else objs
+    roots, bindings = [], []
+    for obj in objs:
+        modifiers = [m for m in obj.modifiers if m.type == "NODES" and m.node_group]
+        if modifiers:
+            bindings.append(f"  {obj.name}:")
+            for modifier in modifiers:
+                bindings.append(f"    {modifier.name}: {modifier.node_group.name}")
+                roots.append(modifier.node_group)
+    if not roots:
+        return ""
+    result = ["NodeGroups:"]
+    for node_group in collect_node_groups(roots):
+        result.extend(f"  {line}" for line in dump_node_group(node_group, simple, idname))
+    result.append("Objects:")
+    result.extend(bindings)
+    return "\n".join(result)
+
+
+def parse_yaml(text: str) -> Any:
+    """YAMLの文字列を読み込む
+
+    :param text: YAMLの文字列
+    :return: 読み込んだ値
+    """
+    return yaml.safe_load(text)
+
+
+def load_node_group(node_group: bpy.types.GeometryNodeTree, ngval: dict[str, Any]) -> None:
+    """ノードグループを作り直す
+
+    :param node_group: ノードグループ
+    :param ngval: ノードグループ1つ分のYAMLの辞書
+    """
+    ngval = ngval.copy()
+    node_group.inputs.clear()
+    node_group.outputs.clear()
+    node_group.nodes.clear()
+    for key, data in zip(["Inputs", "Outputs"], [node_group.inputs, node_group.outputs]):
+        if dc := ngval.pop(key, None):
+            for idntf, ioval in dc.items():
+                name, typ = ioval.split("/")
+                if typ.startswith("NodeSocketFloatFactor"):
+                    typ, dval, mnvl, mxvl = typ.split(",")
+                    sct = data.new(typ, name)
+                    sct.default_value = float(dval)
+                    sct.min_value = float(mnvl)
+                    sct.max_value = float(mxvl)
+                else:
+                    sct = data.new(typ, name)
+                # sct.identifier = idntf  # read-onlyで設定不可
+    nds = {}
+    for key, info in ngval.items():
+        if not (typ := info.get("bl_idname")):
+            typ = class_name(key)
+        nds[key] = nd = node_group.nodes.new(typ)
+        nd.name = key  # 再度貼り付けたときに比較できるように名前を合わせる
+        nd.select = False
+    for key, info in ngval.items():
+        nd = nds[key]
+        for name, value in info.items():
+            if name == "mapping":
+                load_mapping(nd.mapping, value)
+            elif name == "node_tree":
+                nd.node_tree = bpy.data.node_groups.get(value)
+            elif name == "inputs":
+                for sc, dval in value.items():
+                    sct = nd.inputs[sc]
+                    if isinstance(dval, str) and dval.startswith("~"):
+                        lst = dval[1:].split(";")
+                        for pr in lst:
+                            frnd, *rem = pr.split("/")
+                            # 省略時は0とする
+                            frsc = int(rem[0]) if rem else 0
+                            try:
+                                node_group.links.new(nds[frnd].outputs[frsc], sct)
+                            except (KeyError, IndexError) as e:
+                                print(f"\033[31mKeyError {nd.name} {name} {e}\033[0m")
+                    elif sct.bl_idname == "NodeSocketObject":
+                        target = bpy.data.objects.get(dval)
+                        if target:
+                            sct.default_value = target
+                    elif sct.bl_idname == "NodeSocketMaterial":
+                        target = bpy.data.materials.get(dval)
+                        if target:
+                            sct.default_value = target
+                    else:
+                        sct.default_value = dval
+            else:
+                load_attr(nd, name, value)
+                if name == "color":
+                    nd.use_custom_color = True
+
+
+def canonical(value: object) -> object:
+    """比較用に辞書のキーを文字列にしてソートする(リストの順番は保つ)
+
+    :param value: YAMLの値
+    :return: 正規化した値
+    """
+    if isinstance(value, dict):
+        return sorted((str(k), canonical(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [canonical(v) for v in value]
+    return value
+
+
+def fingerprint_node_group(ngval: dict[str, Any]) -> object:
+    """ノードグループ1つ分のYAMLの辞書を比較用に正規化する
+
+    InputsとOutputsはidentifierを除いた順番付きのリストとする(identifierは復元できないため)
+    bl_idnameの省略有無によらず同じ値になる
+
+    :param ngval: ノードグループ1つ分のYAMLの辞書
+    :return: 比較用の値
+    """
+    normalized = {}
+    for key, info in ngval.items():
+        if key in {"Inputs", "Outputs"}:
+            info = list((info or {}).values())
+        elif isinstance(info, dict) and "bl_idname" not in info:
+            info = {**info, "bl_idname": class_name(key)}
+        normalized[key] = info
+    return canonical(normalized)
+
+
+def is_same_node_group(node_group: bpy.types.GeometryNodeTree, ngval: dict[str, Any]) -> bool:
+    """既存のノードグループがYAMLの辞書と同じ内容かどうか
+
+    比較できない場合は異なるとみなす(作り直す)
+    simpleで出力されたYAMLでは、widthは比較しないが、既存にlabelがあれば異なるとみなす
+
+    :param node_group: ノードグループ
+    :param ngval: ノードグループ1つ分のYAMLの辞書
+    :return: 同じ内容か
+    """
+    # simpleでなければ全ノードにwidthがあるので、1つもなければsimpleで出力されたとみなす
+    simple = not any(isinstance(info, dict) and "width" in info for info in ngval.values())
+    try:
+        lines = dump_node_group(node_group, simple=False, idname=True)
+        current = parse_yaml("\n".join(lines))[node_group.name]
+        if simple:
+            for key, info in current.items():
+                if key not in {"Inputs", "Outputs"} and isinstance(info, dict):
+                    info.pop("width", None)
+        return fingerprint_node_group(current) == fingerprint_node_group(ngval)
+    except (AttributeError, ValueError, TypeError, KeyError, yaml.YAMLError):
+        return False
+
+
+def load_node_groups(yml: dict[str, Any]) -> int:
+    """YAMLの辞書から全ノードグループを作成する
+
+    同じ名前で同じ内容のノードグループが既にあれば、作り直さずにそのまま使う
+
+    :param yml: ノードグループ名→ノードグループの辞書
+    :return: 再利用したノードグループの数
+    """
+    reused = 0
     for ngkey, ngval in yml.items():
-        ngval = ngval.copy()
         node_group = bpy.data.node_groups.get(ngkey)
         if not node_group:
             node_group = bpy.data.node_groups.new("Geometry Nodes", "GeometryNodeTree")
             node_group.name = ngkey
-        node_group.inputs.clear()
-        node_group.outputs.clear()
-        node_group.nodes.clear()
-        for key, data in zip(["Inputs", "Outputs"], [node_group.inputs, node_group.outputs]):
-            if dc := ngval.pop(key, None):
-                for idntf, ioval in dc.items():
-                    name, typ = ioval.split("/")
-                    if typ.startswith("NodeSocketFloatFactor"):
-                        typ, dval, mnvl, mxvl = typ.split(",")
-                        sct = data.new(typ, name)
-                        sct.default_value = float(dval)
-                        sct.min_value = float(mnvl)
-                        sct.max_value = float(mxvl)
-                    else:
-                        sct = data.new(typ, name)
-                    # sct.identifier = idntf  # read-onlyで設定不可
-        nds = {}
-        for key, info in ngval.items():
-            if not (typ := info.get("bl_idname")):
-                typ = class_name(key)
-            nds[key] = nd = node_group.nodes.new(typ)
-            nd.select = False
-        for key, info in ngval.items():
-            nd = nds[key]
-            for name, value in info.items():
-                if name == "mapping":
-                    load_mapping(nd.mapping, value)
-                elif name == "node_tree":
-                    nd.node_tree = bpy.data.node_groups.get(value)
-                elif name == "inputs":
-                    for sc, dval in value.items():
-                        sct = nd.inputs[sc]
-                        if isinstance(dval, str) and dval.startswith("~"):
-                            lst = dval[1:].split(";")
-                            for pr in lst:
-                                frnd, *rem = pr.split("/")
-                                # 省略時は0とする
-                                frsc = int(rem[0]) if rem else 0
-                                try:
-                                    node_group.links.new(nds[frnd].outputs[frsc], sct)
-                                except (KeyError, IndexError) as e:
-                                    print(f"\033[31mKeyError {nd.name} {name} {e}\033[0m")
-                        elif sct.bl_idname == "NodeSocketObject":
-                            target = bpy.data.objects.get(dval)
-                            if target:
-                                sct.default_value = target
-                        elif sct.bl_idname == "NodeSocketMaterial":
-                            target = bpy.data.materials.get(dval)
-                            if target:
-                                sct.default_value = target
-                        else:
-                            sct.default_value = dval
-                else:
-                    load_attr(nd, name, value)
-                    if name == "color":
-                        nd.use_custom_color = True
+        elif is_same_node_group(node_group, ngval):
+            reused += 1
+            continue
+        load_node_group(node_group, ngval)
+    return reused
+
+
+def load_geometry_node(yml: Union[dict[str, Any], str], obj: bpy.types.Object = None) -> int:
+    """YAMLからジオメトリーノードを作成する
+
+    :param yml: YAML
+    :param obj: オブジェクト
+    :return: 再利用したノードグループの数
+    """
+    yml = parse_yaml(yml) if isinstance(yml, str) else yml
+    node_group_name = list(yml)[-1] if yml else ""
+    reused = load_node_groups(yml or {})
     obj = obj or bpy.context.object
     if obj:
         print(obj)
@@ -274,6 +427,60 @@ def load_geometry_node(yml: Union[dict[str, Any], str], obj: bpy.types.Object =
         node_group = bpy.data.node_groups.get(node_group_name)
         if node_group:
             modifier.node_group = node_group
+    return reused
+
+
+def is_multi_geometry_node(yml: Union[dict[str, Any], str]) -> bool:
+    """dump_geometry_nodesの出力かどうか
+
+    :param yml: YAML
+    :return: NodeGroupsとObjectsからなるか
+    """
+    yml = parse_yaml(yml) if isinstance(yml, str) else yml
+    return isinstance(yml, dict) and set(yml) == {"NodeGroups", "Objects"}
+
+
+def find_nodes_modifier(
+    obj: bpy.types.Object, modifier_name: str, node_group: bpy.types.GeometryNodeTree
+) -> bpy.types.NodesModifier:
+    """割り当て先のジオメトリーノードのモディファイアーを返す(なければ作成する)
+
+    :param obj: オブジェクト
+    :param modifier_name: モディファイアー名
+    :param node_group: ノードグループ
+    :return: モディファイアー
+    """
+    modifier = obj.modifiers.get(modifier_name)
+    if modifier and modifier.type == "NODES":
+        return modifier
+    # 同名が別種のモディファイアーの場合、Blenderが別名で作成済みのものを探す
+    for modifier in obj.modifiers:
+        if modifier.type == "NODES" and modifier.node_group == node_group:
+            return modifier
+    return obj.modifiers.new(modifier_name, "NODES")
+
+
+def load_geometry_nodes(yml: Union[dict[str, Any], str]) -> tuple[int, list[str]]:
+    """dump_geometry_nodesのYAMLから複数オブジェクトのジオメトリーノードを作成する
+
+    ノードグループは1回だけ作成し、Objectsに記載された全オブジェクトに割り当てる
+
+    :param yml: YAML
+    :return: 再利用したノードグループの数と、見つからなかったオブジェクト名のリスト
+    """
+    yml = parse_yaml(yml) if isinstance(yml, str) else yml
+    if not yml:
+        return 0, []
+    reused = load_node_groups(yml.get("NodeGroups") or {})
+    missing = []
+    for obj_name, bindings in (yml.get("Objects") or {}).items():
+        if not (obj := bpy.data.objects.get(obj_name)):
+            missing.append(obj_name)
+            continue
+        for modifier_name, node_group_name in bindings.items():
+            if node_group := bpy.data.node_groups.get(node_group_name):
+                find_nodes_modifier(obj, modifier_name, node_group).node_group = node_group
+    return reused, missing
 
 
 # https://qiita.com/SaitoTsutomu/items/1bf451085f55bde21224
@@ -61,7 +61,9 @@ def register():
 def unregister():
     for ui_class in ui_classes:
         for k, _ in getmembers(ui_class, _isprop):
-            delattr(bpy.types.Scene, k)
+            # 同名のプロパティを持つクラスが複数あるため、削除済みは無視する
+            if hasattr(bpy.types.Scene, k):
+                delattr(bpy.types.Scene, k)
         bpy.utils.unregister_class(ui_class)
     try:
         from .core import unregister as _unregister